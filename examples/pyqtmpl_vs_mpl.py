@@ -39,10 +39,14 @@ else:
 
 
 def sample_data():
-    x = np.linspace(0, 10, 151)
-    y1 = x**2 + 1
-    y2 = x*10 - 0.1 * x**3 + 50
-    y3 = 85 - y1
+    x = np.linspace(0, 10, 151, dtype=np.float32)
+    # All the curves share x, so keep their y values together as rows of one array; y1, y2, y3 are views of its rows.
+    # Plotting an array doesn't copy it, so every curve drawn against x refers to the same x data.
+    ys = np.empty((3, len(x)), dtype=np.float32)
+    ys[0] = x**2 + 1
+    ys[1] = x*10 - 0.1 * x**3 + 50
+    ys[2] = 85 - ys[0]
+    y1, y2, y3 = ys
     return x, y1, y2, y3
 
 
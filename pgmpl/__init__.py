@@ -16,17 +16,18 @@ from matplotlib import rcParams
 # pgmpl imports
 from pgmpl.info import *  # Defines __version__, etc.
 from pgmpl.util import printd
-from pgmpl.translate import color_translator
+from pgmpl.translate import color_translator, _install_custom_symbols
 
-__all__ = ['figure', 'axes', 'pyplot', 'translate', 'text', 'util']
+__all__ = ['figure', 'axes', 'pyplot', 'translate', 'text', 'util', 'batch']
 
 # Handle debugging
-if os.environ.get('PGMPL_DEBUG', None) is None:
-    os.environ['PGMPL_DEBUG'] = "0"
+os.environ.setdefault('PGMPL_DEBUG', "0")
 
 # Setup style, etc.
-pg.setConfigOption('background', color_translator(**{'color': rcParams['axes.facecolor']}))
-pg.setConfigOption('foreground', color_translator(**{'color': rcParams['axes.edgecolor']}))
+_BACKGROUND = color_translator(color=rcParams['axes.facecolor'])
+_FOREGROUND = color_translator(color=rcParams['axes.edgecolor'])
+pg.setConfigOption('background', _BACKGROUND)
+pg.setConfigOption('foreground', _FOREGROUND)
 
 # Check for an existing QApp and make one if none found so that windows can be opened
 app = QtGui.QApplication.instance()
@@ -35,3 +36,5 @@ if app is None:
     app = QtGui.QApplication(sys.argv)
 else:
     printd('Using pre-existing QApplication.')
+
+_install_custom_symbols()
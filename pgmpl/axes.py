@@ -114,7 +114,7 @@ class Axes(pg.PlotItem):
             # All same default color
             brush_colors = [color_translator(color='b')] * n
         elif is_numeric(tolist(c)[0]):
-            brush_colors = color_map_translator(c, **kwargs)
+            brush_colors = color_map_translator(c, bytes=True, **kwargs)
         else:
             # Assume that c is a list/array of colors
             brush_colors = [color_translator(color=cc) for cc in tolist(c)]
@@ -726,15 +726,18 @@ class AxesImage(pg.ImageItem):
         else:
             extent = kwargs.pop('extent', None) or (-0.5, x.shape[1]-0.5, -0.5, x.shape[0]-0.5)
 
+        imkw = {}
         if len(np.shape(xs)) == 3:
             xs = np.transpose(xs, (2, 0, 1))
         else:
-            xs = np.array(color_map_translator(
+            # Compact uint8 RGBA with fixed levels lets pyqtgraph use the mapped colors as they are, without rescaling
+            xs = color_map_translator(
                 xs.flatten(), cmap=self.cmap, norm=self.norm, vmin=vmin, vmax=vmax, clip=kwargs.pop('clip', False),
-                ncol=kwargs.pop('N', 256), alpha=self.alpha,
-            )).T.reshape([4] + tolist(xs.shape))
+                ncol=kwargs.pop('N', 256), alpha=self.alpha, bytes=True,
+            ).T.reshape([4] + tolist(xs.shape))
+            imkw['levels'] = (0, 255)
 
-        super(AxesImage, self).__init__(np.transpose(xs))
+        super(AxesImage, self).__init__(np.transpose(xs), **imkw)
         if extent is not None:
             self.resetTransform()
             self.translate(extent[0], extent[2])
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# # -*- coding: utf-8 -*-
+
+"""
+Tools for rendering a batch of figures to image files in parallel
+
+Making figures is independent from one figure to the next, so a batch can be spread over several worker processes.
+Each worker has its own QApplication running on Qt's offscreen platform, so no windows are opened.
+"""
+
+# Basic imports
+from __future__ import print_function, division
+import os
+import multiprocessing
+
+# Plotting imports
+from pyqtgraph import QtGui
+
+# pgmpl
+# noinspection PyUnresolvedReferences
+import pgmpl.__init__  # __init__ does setup stuff like making sure a QApp exists
+from pgmpl.util import printd
+
+
+def _render_one(fn_outfile):
+    """
+    Makes one figure and saves it to a file. This runs in the worker processes.
+
+    :param fn_outfile: tuple
+        (fn, outfile): the function to call to make the figure and the filename to save it to
+
+    :return: string
+        The filename that was written
+    """
+    fn, outfile = fn_outfile
+    result = fn()
+    fig = result[0] if isinstance(result, tuple) else result  # Handle functions like demo_plot that return fig, axs
+    pixmap = fig.grab() if hasattr(fig, 'grab') else QtGui.QPixmap.grabWidget(fig)  # Qt4 doesn't have grab()
+    saved = pixmap.save(outfile)
+    fig.close()
+    if not saved:
+        raise IOError('Failed to save figure from {} to {}'.format(fn, outfile))
+    printd('  rendered {} to {}'.format(fn, outfile))
+    return outfile
+
+
+def render_all(fns, outfiles, n_jobs=None):
+    """
+    Renders figures to image files using a pool of worker processes
+
+    On Python 2, which can't start fresh worker processes, the figures are rendered one at a time in this process.
+
+    :param fns: list of callables
+        Functions that make figures. Each should take no arguments and return a Figure (or another QWidget), or a tuple
+        with the figure first, like (fig, axs). The functions are sent to the workers, so they must be picklable
+        (defined at the top level of a module, for example). Workers are started fresh (not forked) and import the
+        caller's main script, so a script calling render_all must protect it with if __name__ == '__main__':
+
+    :param outfiles: list of strings
+        Filenames to save the figures to, one for each function. The format is determined by the extension (png, etc.).
+
+    :param n_jobs: int
+        Number of worker processes. Defaults to the number of CPUs.
+
+    :return: list of strings
+        Filenames that were written
+    """
+    if len(fns) != len(outfiles):
+        raise ValueError('render_all needs one output file per function, but got {} functions and {} files'.format(
+            len(fns), len(outfiles)))
+    n_jobs = n_jobs or multiprocessing.cpu_count()
+
+    # Don't fork: the parent already has a QApplication, which doesn't survive being copied into a child process.
+    try:
+        context = multiprocessing.get_context('spawn')
+    except AttributeError:  # Python 2 can only fork, so don't use a pool at all
+        printd('  render_all: spawn is not available, so rendering serially')
+        return [_render_one(fn_outfile) for fn_outfile in zip(fns, outfiles)]
+
+    # Workers inherit the environment when they start, which is before they import pgmpl and make their QApplication
+    platform = os.environ.get('QT_QPA_PLATFORM', None)
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    try:
+        pool = context.Pool(n_jobs)
+    finally:
+        if platform is None:
+            os.environ.pop('QT_QPA_PLATFORM')
+        else:
+            os.environ['QT_QPA_PLATFORM'] = platform
+    try:
+        written = pool.map(_render_one, list(zip(fns, outfiles)))
+    finally:
+        pool.close()
+        pool.join()
+    return written
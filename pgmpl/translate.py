@@ -9,13 +9,18 @@ Utilities for translating Matplotlib style keywords into PyQtGraph keywords
 from __future__ import print_function, division
 import sys
 import warnings
-import copy
+import numbers
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2 doesn't have lru_cache, so just skip caching and call the function every time
+    def lru_cache(maxsize=128):
+        return lambda function: function
 
 # Calculation imports
 import numpy as np
 
 # Plotting imports
-from pyqtgraph import QtCore
+from pyqtgraph import QtCore, QtGui
 import pyqtgraph as pg
 import matplotlib.cm
 from matplotlib import rcParams
@@ -27,18 +32,84 @@ except ImportError:  # Older Matplotlib versions were organized differently
     to_rgba = colorConverter.to_rgba
 
 # pgmpl imports
-from pgmpl.util import set_debug, printd, tolist
+from pgmpl.util import set_debug, printd, debugging
 from pyqtgraph.graphicsItems.ScatterPlotItem import Symbols
 
-# Install custom symbols
-theta = np.linspace(0, 2 * np.pi, 36)
-Symbols['.'] = pg.arrayToQPath(np.cos(theta) * 0.125, np.sin(theta) * 0.125, connect='all')
-Symbols[','] = pg.arrayToQPath(np.array([-0.01, 0, 0.01, 0, -0.01]), np.array([0, 0.01, 0, -0.01, 0]), connect='all')
-Symbols['_'] = pg.arrayToQPath(np.array([-0.5, 0.5]), np.array([0, 0]), connect='all')
-Symbols['|'] = pg.arrayToQPath(np.array([0, 0]), np.array([-0.5, 0.5]), connect='all')
-Symbols['x'] = pg.arrayToQPath(
-    np.array([-0.5, 0.5, 0, 0.5, -0.5, 0]), np.array([-0.5, 0.5, 0, -0.5, 0.5, 0]), connect='all'
-)
+# Vertices for custom symbols, which are installed into pyqtgraph's Symbols by _install_custom_symbols()
+# The dot's circle is built in one contiguous (2, n) buffer; rows are x and y. Leave it float64: arrayToQPath packs
+# vertices as doubles, so float32 input would just be converted back.
+_theta = np.linspace(0, 2 * np.pi, 36)
+_dot_verts = np.empty((2, len(_theta)))
+np.cos(_theta, out=_dot_verts[0])
+np.sin(_theta, out=_dot_verts[1])
+_dot_verts *= 0.125
+_CUSTOM_SYMBOL_VERTS = {  # symbol: (x, y)
+    '.': (_dot_verts[0], _dot_verts[1]),
+    ',': (np.array([-0.01, 0, 0.01, 0, -0.01]), np.array([0, 0.01, 0, -0.01, 0])),
+    '_': (np.array([-0.5, 0.5]), np.array([0, 0])),
+    '|': (np.array([0, 0]), np.array([-0.5, 0.5])),
+    'x': (np.array([-0.5, 0.5, 0, 0.5, -0.5, 0]), np.array([-0.5, 0.5, 0, -0.5, 0.5, 0])),
+}
+_symbols_installed = False
+
+
+def _install_custom_symbols():
+    """
+    Builds paths for the custom symbols and installs them into pyqtgraph's Symbols dictionary.
+    This is called once by pgmpl's __init__; repeat calls do nothing.
+    """
+    global _symbols_installed
+    if _symbols_installed:
+        return
+    for symbol, (x, y) in _CUSTOM_SYMBOL_VERTS.items():
+        Symbols[symbol] = pg.arrayToQPath(x, y, connect='all')
+    _symbols_installed = True
+
+
+_ALIAS_LISTS = {  # If there is more than one alias, then the first one in the list is used
+    'linewidth': ['lw'],
+    'linestyle': ['ls'],
+    'markeredgewidth': ['mew'],
+    'markeredgecolor': ['mec'],
+    'markerfacecolor': ['mfc'],
+    'markersize': ['ms'],
+    'markerfacecoloralt': ['mfcalt'],
+    'antialiased': ['aa'],
+    'color': ['c'],
+    'edgecolor': ['ec'],
+    'facecolor': ['fc'],
+    'verticalalignment': ['va'],
+    'horizontalalignment': ['ha'],
+}
+# Reverse lookup (alias: primary) built once so dealias() doesn't have to rebuild it for every call
+_ALIAS_TO_PRIMARY = {alias: primary for primary, aliases in _ALIAS_LISTS.items() for alias in aliases}
+
+_RCPARAM_MAP = {  # rcParams key: plot keyword, for defaults_from_rcparams()
+    'lines.linewidth': 'linewidth',
+    'lines.marker': 'marker',
+    'lines.markeredgewidth': 'markeredgewidth',
+    'lines.markersize': 'markersize',
+    'lines.linestyle': 'linestyle',
+}
+
+_MPL_ONLY_KEYS = frozenset((  # Keywords which plotkw_translator() should not pass through to pyqtgraph
+    'color', 'alpha', 'linewidth', 'marker', 'linestyle', 'markeredgewidth', 'markeredgecolor', 'markerfacecolor',
+    'markerfacecoloralt', 'antialiased', 'edgecolor', 'facecolor',
+))
+
+_LINESTYLE_MAP = {  # mpl linestyle: Qt pen style
+    '-': QtCore.Qt.SolidLine,
+    '--': QtCore.Qt.DashLine,
+    '-.': QtCore.Qt.DashDotLine,
+    ':': QtCore.Qt.DotLine,
+    ' ': QtCore.Qt.NoPen,
+    '-..': QtCore.Qt.DashDotDotLine,  # Warning: this one has no mpl equivalent: avoid it
+}
+
+_MARKER_MAP = {  # mpl symbol : pyqt4 symbol
+    '.': '.', ',': ',', 'x': 'x', '+': '+', '*': 'star', 'o': 'o', 'v': 't', '^': 't1', '>': 't2', '<': 't3',
+    'd': 'd', 's': 's', 'p': 'p', 'h': 'h', '_': '_', '|': '|', 'None': None, 'none': None, None: None,
+}
 
 
 def dealias(**kws):
@@ -53,34 +124,16 @@ def dealias(**kws):
     :return: dict
         Dictionary with all aliases replaced by primary keywords (ls is replaced by linestyle, for example)
     """
-    missing_value_mark = 'This value is missing; it is not just None. We want to allow for the possibility that ' \
-                         'keyword=None is treated differently than a missing keyword in some function, because a ' \
-                         'function might not accept unrecognized keywords.'
-    alias_lists = {  # If there is more than one alias, then the first one in the list is used
-        'linewidth': ['lw'],
-        'linestyle': ['ls'],
-        'markeredgewith': ['mew'],
-        'markeredgecolor': ['mec'],
-        'markerfacecolor': ['mfc'],
-        'markersize': ['ms'],
-        'markerfacecoloralt': ['mfcalt'],
-        'antialiased': ['aa'],
-        'color': ['c'],
-        'edgecolor': ['ec'],
-        'facecolor': ['fc'],
-        'verticalalignment': ['va'],
-        'horizontalalignment': ['ha'],
-    }
-    for primary, aliases in list(alias_lists.items()):  # https://stackoverflow.com/a/13998534/6605826
-        aliasv = {alias: kws.pop(alias, missing_value_mark) for alias in aliases}
-        not_missing = [v != missing_value_mark for v in aliasv.values()]
-        if primary not in kws.keys() and any(not_missing):
-            # The aliases only need be considered if the primary is missing.
-            aliasu = np.atleast_1d(list(aliasv.keys()))[np.atleast_1d(not_missing)][0]
-            kws[primary] = aliasv[aliasu]
-            printd("  assigned kws['{}'] = kws.pop('{}')".format(primary, aliasu))
-        else:
-            printd(' did not asssign {}'.format(primary))
+    for alias, primary in _ALIAS_TO_PRIMARY.items():
+        if alias in kws:
+            value = kws.pop(alias)  # Always remove the alias, even if it isn't needed
+            if primary not in kws:
+                # The aliases only need be considered if the primary is missing.
+                kws[primary] = value
+                if debugging():
+                    printd("  assigned kws['{}'] = kws.pop('{}')".format(primary, alias))
+            elif debugging():
+                printd(' did not asssign {}'.format(primary))
     return kws
 
 
@@ -95,26 +148,54 @@ def defaults_from_rcparams(plotkw):
     :return: dict
         Input dictionary with missing keywords filled in using defaults
     """
-    params = {  # If you have a parameter that can't be assigned simply by just splitting after ., then set it up here.
-        # 'lines.linestyle': 'linestyle',  # This can go in simples instead, but here's how it would go for example.
-    }
-    simples = ['lines.linewidth', 'lines.marker', 'lines.markeredgewidth', 'lines.markersize', 'lines.linestyle']
-    for simple in simples:
-        params[simple] = '.'.join(simple.split('.')[1:])
-
-    for param in params.keys():
-        if not params[param] in plotkw.keys():
+    for param, key in _RCPARAM_MAP.items():
+        if key not in plotkw:
             # Keyword is missing
-            plotkw[params[param]] = rcParams[param]
-            printd("  assigned plotkw['{}'] = rcParams[{}] = {}".format(params[param], param, rcParams[param]),
-                   level=2)
-        else:
+            plotkw[key] = rcParams[param]
+            if debugging(2):
+                printd("  assigned plotkw['{}'] = rcParams[{}] = {}".format(key, param, rcParams[param]), level=2)
+        elif debugging(2):
             printd("  keywords {} exists in plotkw; no need to assign default from rcParams['{}']".format(
-                params[param], param), level=2)
+                key, param), level=2)
 
     return plotkw
 
 
+def _is_color_cycle_ref(c):
+    """Checks for color cycle references like 'C1', which depend on rcParams"""
+    return isinstance(c, str) and c[:1] == 'C' and c[1:].isdigit()
+
+
+@lru_cache(maxsize=256)
+def _cached_to_rgba(c):
+    """Memoized version of to_rgba() for the hashable color specifications that get reused over and over"""
+    return to_rgba(c)
+
+
+def _to_rgba(c):
+    """
+    Wrapper for to_rgba() which avoids parsing the same color specification again and again
+
+    :param c: Matplotlib style color specification
+
+    :return: tuple
+        RGBA color description (each from 0 to 1)
+    """
+    if isinstance(c, (tuple, list, np.ndarray)) and np.ndim(c) == 1 and len(c) in [3, 4]:
+        # Might already be RGB or RGBA (like output from a colormap), which doesn't need to go through Matplotlib
+        rgba = np.asarray(c)
+        # Only take real numbers; anything else (like color names, or numeric strings for grays) goes to Matplotlib
+        if rgba.dtype.kind in 'biuf' and ((rgba >= 0) & (rgba <= 1)).all():
+            rgba = rgba.astype(float)
+            return tuple(rgba) if len(rgba) == 4 else tuple(rgba) + (1.0,)
+    if _is_color_cycle_ref(c):
+        return to_rgba(c)  # Don't cache color cycle references like 'C1': they depend on rcParams, which can change
+    try:
+        return _cached_to_rgba(c)
+    except TypeError:  # Unhashable, like a list or array
+        return to_rgba(c)
+
+
 def color_translator(**kw):
     """
     Translates colors specified in the Matplotlib system into pyqtgraph color descriptions
@@ -123,21 +204,23 @@ def color_translator(**kw):
         Dictionary of Matplotlib style plot keywords in which color may be specified. The entire set of mpl plot
         keywords may be passed in, although only color-relevant ones will be used.
 
-    :return: iterable
+    :return: tuple
         An RGBA color description (each from 0 to 255) for use with pyqtgraph
     """
     if 'color' in kw and kw['color'] is not None:
-        try:
-            printd('    color_translator input: kw["color"] = {}, to_rgba(kw.get("color", None)) = {}'.format(
-                kw.get('color', None), to_rgba(kw.get('color', None))), level=3)
-        except ValueError:
-            printd('    color_translator input: kw["color"] = {}'.format(kw.get('color', None)), level=3)
-        if kw['color'] in ['', ' ']:
+        if debugging(3):  # Skip making the message unless it will be printed; to_rgba can be expensive
+            try:
+                printd('    color_translator input: kw["color"] = {}, to_rgba(kw.get("color", None)) = {}'.format(
+                    kw.get('color', None), _to_rgba(kw.get('color', None))), level=3)
+            except ValueError:
+                printd('    color_translator input: kw["color"] = {}'.format(kw.get('color', None)), level=3)
+        if isinstance(kw['color'], str) and kw['color'] in ['', ' ']:
             return 0, 0, 0, 0  # Empty strings and spaces are code for invisible (alpha = 0)
-        elif 'alpha' in kw and kw['alpha'] is not None:
-            return np.append(np.array(to_rgba(kw['color']))[0:3], kw['alpha']) * 255
-        else:
-            return np.array(to_rgba(kw['color'])) * 255
+        # Plain tuples are cheaper than numpy arrays for 4 numbers
+        r, g, b, a = _to_rgba(kw['color'])
+        if 'alpha' in kw and kw['alpha'] is not None:
+            a = kw['alpha']
+        return r * 255, g * 255, b * 255, a * 255
     else:
         return (0, 0, 0, int(round(kw['alpha'] * 255))) if 'alpha' in kw and kw['alpha'] is not None else None
 
@@ -170,8 +253,12 @@ def color_map_translator(x, **kw):
     :param alpha: float:
         opacity from 0 to 1 or None
 
-    :return: list
-        List of pyqtgraph-compatible color specifications with length matching x
+    :param bytes: bool
+        Return compact uint8 RGBA values instead of floats, like the bytes keyword to a Matplotlib Colormap. This is
+        an eighth the size of the default float output, which helps with large datasets like images or big scatters.
+
+    :return: array
+        Array of pyqtgraph-compatible RGBA color specifications (each from 0 to 255) with shape (len(x), 4)
     """
     printd('color_map_translator...')
     norm = kw.pop('norm', None)
@@ -179,8 +266,13 @@ def color_map_translator(x, **kw):
         printd('  norm was None, normalizing...')
         norm = Normalize(vmin=kw.pop('vmin', None), vmax=kw.pop('vmax', None), clip=kw.pop('clip', False))
     comap = matplotlib.cm.get_cmap(kw.pop('cmap', None), lut=kw.pop('ncol', 256))
-    colors = comap(norm(np.atleast_1d(x)))
-    return [color_translator(color=color, alpha=kw.get('alpha', None)) for color in tolist(colors)]
+    alpha = kw.get('alpha', None)
+    if kw.get('bytes', False):
+        return comap(norm(np.atleast_1d(x)), alpha=alpha, bytes=True)
+    colors = comap(norm(np.atleast_1d(x)))  # The colormap already gives RGBA from 0 to 1, so just scale it up
+    if alpha is not None:
+        colors[..., 3] = alpha
+    return colors * 255
 
 
 def style_translator(**kw):
@@ -191,18 +283,7 @@ def style_translator(**kw):
         keywords may be passed in, although only linestyle-relevant ones will be used.
     :return: A Qt pen style suitable for use in pyqtgraph.mkPen()
     """
-    if 'linestyle' in kw.keys():
-        style = {
-            '-': QtCore.Qt.SolidLine,
-            '--': QtCore.Qt.DashLine,
-            '-.': QtCore.Qt.DashDotLine,
-            ':': QtCore.Qt.DotLine,
-            ' ': QtCore.Qt.NoPen,
-            '-..': QtCore.Qt.DashDotDotLine,  # Warning: this one has no mpl equivalent: avoid it
-        }.get(kw['linestyle'], None)
-    else:
-        style = None
-    return style
+    return _LINESTYLE_MAP.get(kw['linestyle'], None) if 'linestyle' in kw else None
 
 
 def symbol_translator(**kw):
@@ -216,12 +297,7 @@ def symbol_translator(**kw):
     :return: string
         Code for the relevant pyqtgraph symbol.
     """
-    # mpl symbol : pyqt4 symbol
-    pyqt_symbol = {
-        '.': '.', ',': ',', 'x': 'x', '+': '+', '*': 'star', 'o': 'o', 'v': 't', '^': 't1', '>': 't2', '<': 't3',
-        'd': 'd', 's': 's', 'p': 'p', 'h': 'h', '_': '_', '|': '|', 'None': None, 'none': None, None: None,
-    }.get(kw.get('marker', None), 'o')
-    return pyqt_symbol
+    return _MARKER_MAP.get(kw.get('marker', None), 'o')
 
 
 def symbol_edge_setup(pgkw, plotkw):
@@ -232,8 +308,8 @@ def symbol_edge_setup(pgkw, plotkw):
 
     :param plotkw: Dictionary of matplotlib style keywords (translation in progress)
     """
-    default_mec = plotkw.get('color', None) if plotkw.get('marker', '') in ['x', '+', '.', ',', '|', '_'] else None
-    mec = plotkw.pop('markeredgecolor', default_mec)
+    # Like Matplotlib, marker edges match the line color unless told otherwise
+    mec = plotkw.pop('markeredgecolor', plotkw.get('color', None))
     mew = plotkw.pop('markeredgewidth', None)
     symbol = symbol_translator(**plotkw)
     if symbol is not None:
@@ -243,7 +319,7 @@ def symbol_edge_setup(pgkw, plotkw):
         if mec is not None:
             penkw['color'] = mec
         if mew is not None:
-            penkw['width'] = mew
+            penkw['linewidth'] = mew  # setup_pen_kw translates linewidth into the pen's width
         if 'alpha' in plotkw:
             penkw['alpha'] = plotkw.pop('alpha')
         if len(penkw.keys()):
@@ -255,13 +331,14 @@ def symbol_edge_setup(pgkw, plotkw):
         if brush_color is not None:
             brushkw['color'] = brush_color
         if len(brushkw.keys()):
-            pgkw['symbolBrush'] = pg.mkBrush(**brushkw)
+            pgkw['symbolBrush'] = _make_brush(**brushkw)
     else:
         pgkw.pop('symbolSize', None)  # This isn't used when symbol is undefined, but it can cause problems, so remove.
-    printd('plotkw symbol = {}; symbol = {}'.format(plotkw.get('symbol', 'no symbol defined'), symbol), level=1)
+    if debugging():
+        printd('plotkw symbol = {}; symbol = {}'.format(plotkw.get('symbol', 'no symbol defined'), symbol), level=1)
 
 
-def setup_pen_kw(penkw={}, **kw):
+def setup_pen_kw(penkw=None, **kw):
     """
     Builds a pyqtgraph pen (object containing color, linestyle, etc. information) from Matplotlib keywords.
     Please dealias first.
@@ -278,6 +355,8 @@ def setup_pen_kw(penkw={}, **kw):
         A pen which can be input with the pen keyword to many pyqtgraph functions
     """
 
+    penkw = {} if penkw is None else dict(penkw)  # Don't modify the input or (worse) a shared default
+
     # Move the easy keywords over directly
     direct_translations_pen = {  # plotkw: pgkw
         'linewidth': 'width',
@@ -285,6 +364,8 @@ def setup_pen_kw(penkw={}, **kw):
     for direct in direct_translations_pen:
         if direct in kw and kw[direct] is not None:
             penkw[direct_translations_pen[direct]] = kw[direct]
+    if 'width' in penkw:
+        penkw['width'] = _snap_to_half_pixel(penkw['width'])
 
     # Handle colors
     newc = color_translator(**kw)
@@ -296,13 +377,131 @@ def setup_pen_kw(penkw={}, **kw):
     if news is not None:
         penkw['style'] = news
 
-    return pg.mkPen(**penkw) if len(penkw.keys()) else None
+    return _make_pen(**penkw) if len(penkw.keys()) else None
+
+
+# Python 3's round() rounds halves to even, like np.round, but Python 2's rounds them away from zero
+_round_half_even = round if sys.version_info[0] >= 3 else lambda value: float(np.round(value))
+
+
+def _snap_to_half_pixel(size):
+    """
+    Rounds sizes (like symbol sizes or line widths) to the nearest half pixel. pyqtgraph caches rendered symbols by
+    size, so having fewer distinct sizes means more reuse. Sizes that would round to 0 are left alone.
+
+    :param size: numeric scalar or iterable
+
+    :return: float or array
+        size rounded to the nearest 0.5
+    """
+    if isinstance(size, numbers.Real):  # Plain scalars are the usual case, and numpy is slow for those
+        doubled = _round_half_even(size * 2)
+        return doubled / 2 if doubled > 0 else float(size)
+    doubled = np.round(np.multiply(size, 2))
+    snapped = np.where(doubled > 0, doubled / 2, size)
+    return float(snapped) if np.ndim(snapped) == 0 else snapped
+
+
+def _freeze_kw(kw):
+    """
+    Converts a keyword dictionary into a sorted tuple of items that can be used as a key for caching
+
+    :param kw: dict
+        Keywords, possibly with array or list values like colors
+
+    :return: tuple
+        (keyword, value) pairs with arrays and lists converted to tuples. Other unhashable values are left alone.
+    """
+    return tuple(sorted(
+        (k, tuple(np.asarray(v).tolist()) if isinstance(v, (list, np.ndarray)) else v) for k, v in kw.items()
+    ))
+
+
+@lru_cache(maxsize=256)
+def _cached_pen(frozen_penkw):
+    return pg.mkPen(**dict(frozen_penkw))
+
+
+@lru_cache(maxsize=256)
+def _cached_brush(frozen_brushkw):
+    return pg.mkBrush(**dict(frozen_brushkw))
+
+
+def _make_pen(**penkw):
+    """
+    Like pg.mkPen(), but reuses the work of building pens with repeated settings. Each call gets its own copy (copies
+    of Qt pens are implicitly shared, so this is cheap), so changing one won't affect the others.
+    """
+    try:
+        return QtGui.QPen(_cached_pen(_freeze_kw(penkw)))
+    except TypeError:  # Unhashable, like a QColor
+        return pg.mkPen(**penkw)
+
+
+def _make_brush(**brushkw):
+    """Like pg.mkBrush(), but reuses brushes with repeated settings the same way _make_pen() reuses pens"""
+    try:
+        return QtGui.QBrush(_cached_brush(_freeze_kw(brushkw)))
+    except TypeError:
+        return pg.mkBrush(**brushkw)
 
 
 def plotkw_translator(**plotkw):
     """
     Translates matplotlib plot keyword dictionary into a keyword dictionary suitable for pyqtgraph plot functions
 
+    Many curves tend to be drawn with the same style keywords, so translations of hashable keyword sets are cached.
+
+    :param plotkw: dict
+        Dictionary of matplotlib plot() keywords
+
+    :return: dict
+        Dictionary of pyqtgraph plot keywords
+    """
+    if any(_is_color_cycle_ref(v) for v in plotkw.values()):
+        return _plotkw_translator(**plotkw)  # Color cycle references depend on rcParams; don't cache
+    # rcParams can change, so the defaults that would be taken from it are part of the key
+    key = (tuple(sorted(plotkw.items())), tuple(rcParams[param] for param in _RCPARAM_MAP))
+    try:
+        hash(key)
+    except TypeError:  # Unhashable keywords, like arrays
+        return _plotkw_translator(**plotkw)
+    return _copy_pgkw(_cached_plotkw_translator(key))
+
+
+@lru_cache(maxsize=128)
+def _cached_plotkw_translator(key):
+    """Memoized version of _plotkw_translator(); key is made by plotkw_translator()"""
+    return _plotkw_translator(**dict(key[0]))
+
+
+def _copy_pgkw(pgkw):
+    """
+    Copies a dictionary of pyqtgraph keywords, including pens, brushes, and arrays, so changing it won't affect the
+    cached one
+
+    :param pgkw: dict
+        Dictionary of pyqtgraph plot keywords
+
+    :return: dict
+        Copy of pgkw
+    """
+    new = {}
+    for k, v in pgkw.items():
+        if isinstance(v, QtGui.QPen):
+            v = QtGui.QPen(v)
+        elif isinstance(v, QtGui.QBrush):
+            v = QtGui.QBrush(v)
+        elif isinstance(v, np.ndarray):  # Like symbolSize after snapping a tuple of sizes
+            v = v.copy()
+        new[k] = v
+    return new
+
+
+def _plotkw_translator(**plotkw):
+    """
+    Does the work for plotkw_translator() without any caching
+
     :param plotkw: dict
         Dictionary of matplotlib plot() keywords
 
@@ -311,7 +510,9 @@ def plotkw_translator(**plotkw):
     """
 
     pgkw = {}
-    plotkw = dealias(**copy.deepcopy(plotkw))  # Copy: Don't break the original in case it's needed for other calls
+    # dealias(**) receives a new (shallow) dict, so the caller's keywords aren't broken in case they're needed for
+    # other calls. Only top level keys are popped or replaced, so there is no need for a deep copy.
+    plotkw = dealias(**plotkw)
     plotkw = defaults_from_rcparams(plotkw)
 
     # First define the pen -----------------------------------------------------------------------------------------
@@ -329,15 +530,15 @@ def plotkw_translator(**plotkw):
     for direct in direct_translations:
         if direct in plotkw:
             pgkw[direct_translations[direct]] = plotkw.pop(direct)
+    if pgkw.get('symbolSize', None) is not None:
+        pgkw['symbolSize'] = _snap_to_half_pixel(pgkw['symbolSize'])
 
     # Handle symbol edge
     symbol_edge_setup(pgkw, plotkw)
 
-    # Pass through other keywords
-    late_pops = ['color', 'alpha', 'linewidth', 'marker', 'linestyle']
-    for late_pop in late_pops:
-        # Didn't pop yet because used in a few places or popping above is inside of an if and may not have happened
-        plotkw.pop(late_pop, None)
-    plotkw.update(pgkw)
+    # Pass through other keywords, leaving out the mpl keywords that have been translated or have no pg equivalent
+    # (some weren't popped yet because they're used in a few places or popping above may not have happened)
+    result = {k: v for k, v in plotkw.items() if k not in _MPL_ONLY_KEYS}
+    result.update(pgkw)
 
-    return plotkw
+    return result
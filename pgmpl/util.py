@@ -7,12 +7,33 @@ import os
 import numpy as np
 
 
+# Read the debug level once; set_debug() keeps this and the environment variable in sync afterwards
+_DEBUG_LEVEL = int(os.environ.get('PGMPL_DEBUG', "0"))
+
+
 def set_debug(enable=True):
-    flag = str(int(bool(enable)))
-    os.environ['PGMPL_DEBUG'] = flag
+    """
+    Sets the debugging level used by printd
+    :param enable: bool or int
+        True/False to turn debugging on/off, or an int to select a debugging level
+    """
+    global _DEBUG_LEVEL
+    _DEBUG_LEVEL = int(enable) if is_numeric(enable) else int(bool(enable))
+    flag = str(_DEBUG_LEVEL)
+    os.environ['PGMPL_DEBUG'] = flag  # Keep the environment variable up to date for subprocesses
     printd('pgmpl debugging set to {}'.format(flag))
 
 
+def debugging(level=1):
+    """
+    Checks whether debug messages at this level would be printed, so callers can skip building expensive messages
+    :param level: int
+        Debugging level
+    :return: bool
+    """
+    return _DEBUG_LEVEL >= level
+
+
 def printd(*args, **kw):
     """
     Prints only if debug flag is turned on (greater than level)
@@ -20,13 +41,12 @@ def printd(*args, **kw):
     :param level: int
         Debugging level
     """
-    debug = os.environ.get('PGMPL_DEBUG', "0")
-    if int(debug) >= kw.pop('level', 1):
+    if _DEBUG_LEVEL >= kw.pop('level', 1):
         print(*args)
 
 
 def tolist(x):
-    return np.ndarray.tolist(np.atleast_1d(x))
+    return np.atleast_1d(x).tolist()
 
 
 def is_iterable(x):  # https://stackoverflow.com/a/1952481/6605826
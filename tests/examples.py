@@ -32,10 +32,13 @@ def demo_plot():
     """
     Big, multi-panel demo plot that uses many different methods
     """
-    x = np.linspace(0, 10, 151)
-    y1 = x**2 + 1
-    y2 = x*10 - 0.1 * x**3 + 50
-    y3 = 85 - y1
+    x = np.linspace(0, 10, 151, dtype=np.float32)
+    # The curves share x, so keep their y values together as rows of one array; plotting doesn't copy x or the rows
+    ys = np.empty((3, len(x)), dtype=np.float32)
+    ys[0] = x**2 + 1
+    ys[1] = x*10 - 0.1 * x**3 + 50
+    ys[2] = 85 - ys[0]
+    y1, y2, y3 = ys
     fig, axs = plt.subplots(3, 2, sharex='col', sharey='row', gridspec_kw={'left': 0.25, 'right': 0.95}, dpi=150)
     axs[-1, 0].set_xlabel('x')
     axs[-1, 1].set_xlabel('X')
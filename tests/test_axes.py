@@ -73,6 +73,9 @@ class TestPgmplAxes(unittest.TestCase):
         assert isinstance(img, AxesImage)
         assert isinstance(img1, AxesImage)
         assert isinstance(img2, AxesImage)
+        # Color mapped images are handed to pyqtgraph as uint8 RGBA with levels that don't rescale the colors
+        assert img2.image.dtype == np.uint8
+        assert list(img2.getLevels()) == [0, 255]
         ax.imshow(data={'x': a})
         self.printv('      test_axes_imshow: ax = {}, ax1 = {}, ax2 = {}, img = {}, img1 = {}, img2 = {}'.format(
                ax, ax1, ax2, img, img1, img2))
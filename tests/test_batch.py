@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# # -*- coding: utf-8 -*-
+
+"""
+Test script for batch.py
+"""
+
+# Basic imports
+from __future__ import print_function, division
+import os
+import unittest
+import tempfile
+import shutil
+import numpy as np
+
+# Plotting imports
+import pyqtgraph as pg
+
+# pgmpl
+from pgmpl import __init__  # __init__ does setup stuff like making sure a QApp exists
+from pgmpl.batch import render_all
+
+
+def make_plot():
+    """Makes a simple plot to render; must be at the top level so it can be sent to the worker processes"""
+    widget = pg.PlotWidget()
+    widget.resize(200, 150)
+    widget.plot(np.linspace(0, 1, 11), np.linspace(0, 1, 11)**2)
+    return widget, None
+
+
+class TestPgmplBatch(unittest.TestCase):
+
+    verbose = int(os.environ.get('PGMPL_TEST_VERBOSE', '0'))
+
+    def printv(self, *args):
+        if self.verbose:
+            print(*args)
+
+    def test_render_all(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            outfiles = [os.path.join(tmpdir, 'plot{}.png'.format(i)) for i in range(3)]
+            written = render_all([make_plot] * 3, outfiles, n_jobs=2)
+            assert written == outfiles
+            for outfile in outfiles:
+                assert os.path.getsize(outfile) > 0
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_render_all_save_fails(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            with self.assertRaises(IOError):
+                render_all([make_plot], [os.path.join(tmpdir, 'nonexistent_dir', 'plot.png')], n_jobs=1)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_render_all_mismatch(self):
+        with self.assertRaises(ValueError):
+            render_all([make_plot], [])
+
+    def setUp(self):
+        test_id = self.id()
+        test_name = '.'.join(test_id.split('.')[-2:])
+        self.printv('{}...'.format(test_name))
+
+    def tearDown(self):
+        test_name = '.'.join(self.id().split('.')[-2:])
+        self.printv('    {} done.'.format(test_name))
+
+
+if __name__ == '__main__':
+    unittest.main()
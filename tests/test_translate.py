@@ -18,7 +18,7 @@ from matplotlib import rcParams
 from pgmpl import __init__  # __init__ does setup stuff like making sure a QApp exists
 from pgmpl.util import set_debug
 from pgmpl.translate import defaults_from_rcparams, color_translator, style_translator, symbol_translator, \
-    setup_pen_kw, plotkw_translator, dealias, color_map_translator
+    setup_pen_kw, plotkw_translator, dealias, color_map_translator, _install_custom_symbols, _snap_to_half_pixel
 
 
 class TestPgmplTranslate(unittest.TestCase):
@@ -71,6 +71,15 @@ class TestPgmplTranslate(unittest.TestCase):
         assert all(color_translator(color=(1, 0.5, 1)) == np.array([255., 255/2., 255., 255.]))
         assert all(color_translator(color=(1, 0.5, 1, 0.5)) == np.array([255., 255/2., 255., 255./2.]))
         assert all(color_translator(color=(1, 0.5, 1), alpha=0.5) == np.array([255., 255/2., 255., 255./2.]))
+        assert all(color_translator(color=[1, 0.5, 1]) == np.array([255., 255/2., 255., 255.]))  # Unhashable
+        assert all(color_translator(color='r') == np.array([255., 0., 0., 255.]))  # Repeat; should hit the cache
+        assert all(color_translator(color=np.array([0, 0.5, 1, 1])) == np.array([0., 255/2., 255., 255.]))
+        with self.assertRaises(ValueError):
+            color_translator(color=(1, 2, 3))  # Out of range RGB values should still be rejected by Matplotlib
+        with self.assertRaises(ValueError):
+            color_translator(color=('1', '0', '0'))  # Numeric strings aren't RGB values
+        with self.assertRaises(ValueError):
+            color_translator(color=['0.5', '0.2', '0.1'])  # A list of grays is not one color
 
     def test_style_translator(self):
         news = [None] * self.nt
@@ -99,16 +108,62 @@ class TestPgmplTranslate(unittest.TestCase):
             assert isinstance(symbol_translator(marker=custom), QtGui.QPainterPath) \
                    or isinstance(Symbols.get(custom, None), QtGui.QPainterPath)
 
+    def test__install_custom_symbols(self):
+        from pyqtgraph.graphicsItems.ScatterPlotItem import Symbols
+        _install_custom_symbols()  # Already done by __init__, so this should be harmless
+        for custom in '_x|,.':
+            assert isinstance(Symbols[custom], QtGui.QPainterPath)
+
     def test_setup_pen_kw(self):
         newp = [None] * self.nt
         for i in range(self.nt):
             newp[i] = setup_pen_kw(**self.plot_kw_tests[i])
             assert isinstance(newp[i], QtGui.QPen)
+        # Repeated settings give equal pens, but each call gets its own that can be changed safely
+        assert setup_pen_kw(color='r', linewidth=2) == setup_pen_kw(color='r', linewidth=2)
+        assert setup_pen_kw(color='r', linewidth=2) is not setup_pen_kw(color='r', linewidth=2)
+        assert setup_pen_kw(color='r', linewidth=2) != setup_pen_kw(color='r', linewidth=3)
+        assert setup_pen_kw(color='r', linewidth=2).width() == 2
+        setup_pen_kw(color='r', linewidth=2).setWidth(11)
+        assert setup_pen_kw(color='r', linewidth=2).width() == 2
 
     def test_plotkw_translator(self):
         newk = [{}] * self.nt
         for i in range(self.nt):
             newk[i] = plotkw_translator(**self.plot_kw_tests[i])
+        # Repeated calls may be served from the cache, but must not hand out the same pen
+        k1 = plotkw_translator(color='r', linestyle='--')
+        k2 = plotkw_translator(color='r', linestyle='--')
+        assert k1['pen'] == k2['pen']
+        assert k1['pen'] is not k2['pen']
+        k1['pen'].setWidth(11)
+        assert plotkw_translator(color='r', linestyle='--')['pen'].width() != 11
+        # Symbol sizes and line widths are rounded to the nearest half pixel
+        k4 = plotkw_translator(marker='o', markersize=6.3, linewidth=1.2)
+        assert k4['symbolSize'] == 6.5
+        assert k4['pen'].widthF() == 1.0
+        assert all(plotkw_translator(marker='o', markersize=np.array([6.3, 0.1]))['symbolSize'] == [6.5, 0.1])
+        # Scalars and arrays snap the same way, including halves
+        assert [_snap_to_half_pixel(v) for v in [1.25, 1.75]] == list(_snap_to_half_pixel(np.array([1.25, 1.75])))
+        k5 = plotkw_translator(marker='o', markersize=(5.2, 6.1))
+        k5['symbolSize'][0] = 99
+        assert plotkw_translator(marker='o', markersize=(5.2, 6.1))['symbolSize'][0] == 5.0
+        # Marker edges default to the line color, and markeredgewidth sets their width
+        sympen = plotkw_translator(color='r', marker='o')['symbolPen']
+        assert sympen.color().getRgb() == (255, 0, 0, 255)
+        assert sympen.widthF() == _snap_to_half_pixel(rcParams['lines.markeredgewidth'])
+        sympen = plotkw_translator(color='r', marker='o', mec='b', mew=3)['symbolPen']
+        assert sympen.color().getRgb() == (0, 0, 255, 255)
+        assert sympen.widthF() == 3
+        # mpl keywords shouldn't leak through to pyqtgraph
+        k3 = plotkw_translator(color='r', markerfacecolor='b', antialiased=True, blah=5)
+        assert 'color' not in k3 and 'markerfacecolor' not in k3 and 'antialiased' not in k3
+        assert k3['blah'] == 5
+        # Unhashable keywords skip the cache
+        plotkw_translator(color=[1, 0, 0])['pen'].setWidth(11)  # Changing this pen mustn't affect other results
+        assert plotkw_translator(color='r')['pen'].widthF() != 11
+        assert plotkw_translator(color='r', marker='s')['pen'].widthF() != 11
+        assert isinstance(plotkw_translator(color=[1, 0, 0])['pen'], QtGui.QPen)
 
     def test_dealias(self):
         test_dict = {'lw': 5, 'ls': '--', 'mec': 'r', 'markeredgewidth': 1, 'blah': 0}
@@ -119,6 +174,8 @@ class TestPgmplTranslate(unittest.TestCase):
         assert dealias(lw=8) == {'linewidth': 8}
         assert dealias(blah=58) == {'blah': 58}
         assert dealias(mec='r') == {'markeredgecolor': 'r'}
+        assert dealias(mew=2) == {'markeredgewidth': 2}
+        assert dealias(lw=8, linewidth=3) == {'linewidth': 3}
 
     def test_color_map_translator(self):
         x = [0, 1, 2, 3, 5, 9, 10, 22]
@@ -130,6 +187,11 @@ class TestPgmplTranslate(unittest.TestCase):
         assert len(m2) == 3
         assert len(m3) == len(x)
         assert any((np.atleast_1d(m3) != np.atleast_1d(m4)).flatten())
+        assert np.shape(m3) == (len(x), 4)
+        assert all(m1[:, 3] == 255 * 0.5)
+        m5 = color_map_translator(x, cmap='plasma', alpha=0.5, bytes=True)
+        assert m5.dtype == np.uint8
+        assert np.allclose(m5, color_map_translator(x, cmap='plasma', alpha=0.5), atol=1)
 
     def setUp(self):
         test_id = self.id()
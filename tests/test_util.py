@@ -13,7 +13,7 @@ import os
 
 # pgmpl
 from pgmpl import __init__  # __init__ does setup stuff like making sure a QApp exists
-from pgmpl.util import tolist, printd, is_iterable, set_debug
+from pgmpl.util import tolist, printd, is_iterable, set_debug, debugging
 
 
 class TestPgmplUtil(unittest.TestCase):
@@ -41,18 +41,29 @@ class TestPgmplUtil(unittest.TestCase):
         assert os.environ.get('PGMPL_DEBUG', None) == "1"
         set_debug(None)
         assert os.environ.get('PGMPL_DEBUG', None) == "0"
+        set_debug(3)
+        assert os.environ.get('PGMPL_DEBUG', None) == "3"
+        set_debug(0)
+
+    def test_debugging(self):
+        set_debug(2)
+        assert debugging()
+        assert debugging(2)
+        assert not debugging(3)
+        set_debug(0)
+        assert not debugging()
 
     def test_printd(self):
         test_string_1 = '\nthis string should print, but the other string should not'
         test_string_2 = '\nthis string should NOT print, but the other string SHOULD'
         debug = os.environ.get('PGMPL_DEBUG', "0")
-        os.environ['PGMPL_DEBUG'] = "1"
+        set_debug(1)
         printd(test_string_1)
         printd('this-should-print:', 'test-item-1a', 'test_item_2a_in-list-of-things', 5, 6, 'more-things-in-the-list')
-        os.environ['PGMPL_DEBUG'] = "0"
+        set_debug(0)
         printd(test_string_2)
         printd('SHOULD-NOT-PRINT:', 'test-item-1b', 'testitem2b-in-a-listofthings', 5, 6.1, 'morelistlol', 'blah')
-        os.environ['PGMPL_DEBUG'] = debug  # Put it back how it was (polite~~)
+        set_debug(int(debug))  # Put it back how it was (polite~~)
 
     def test_tolist(self):
         ar = np.array([1, 2, 3])